@@ -1,30 +1,44 @@
 #!/usr/bin/env python3
 
 import json
+import math
 import os
-import shutil
 import sys
 import traceback
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+    from PIL import Image, ImageTk
+    _HAVE_PIL = True
+except ImportError:
+    _HAVE_PIL = False
+
 # --------------------------------------------------
 # Configuration
 # --------------------------------------------------
 
 PROGRAM_FILENAME = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "pf_tracker"
 SUMMARY_FILENAME = f"{PROGRAM_FILENAME}_summary.json"
-BACKUP_SUFFIX = ".backup"
+EXPORT_FILENAME = f"{PROGRAM_FILENAME}_summary_readable.json"
+TEMP_SUFFIX = ".tmp"
 
-INCOME_CATEGORIES = ["Salary", "Gift", "Investment", "Other"]
-EXPENSE_CATEGORIES = ["Food", "Housing", "Transportation", "Entertainment", "Health", "Education", "Other"]
-
-DEFAULT_SUMMARY = {
-    "income": {c: 0.0 for c in INCOME_CATEGORIES},
-    "expenses": {c: 0.0 for c in EXPENSE_CATEGORIES},
+# Template only; use fresh_default() for a copy that is safe to mutate
+_DEFAULT_SUMMARY = {
+    "income": {"Salary": 0.0, "Gift": 0.0, "Investment": 0.0, "Other": 0.0},
+    "expenses": {"Food": 0.0, "Housing": 0.0, "Transportation": 0.0, "Entertainment": 0.0, "Health": 0.0, "Education": 0.0, "Other": 0.0},
 }
 
+INCOME_CATEGORIES = list(_DEFAULT_SUMMARY["income"])
+EXPENSE_CATEGORIES = list(_DEFAULT_SUMMARY["expenses"])
+
 # Window
 WINDOW_WIDTH = 1390
 WINDOW_HEIGHT = 770
@@ -46,63 +60,120 @@ BOX_WIDTH = 640
 BUTTON_WIDTH = 360
 BUTTON_HEIGHT = 52
 
+# Submits within this window are written to disk together
+SAVE_DELAY_MS = 500
+
 # --------------------------------------------------
 # File utilities
 # --------------------------------------------------
 
-def _summary_path():
+def _resolve_summary_path():
     try:
         return Path(__file__).resolve().parent / SUMMARY_FILENAME
     except Exception:
         return Path.cwd() / SUMMARY_FILENAME
 
 
+_SUMMARY_PATH = _resolve_summary_path()
+
+
+def _summary_path():
+    return _SUMMARY_PATH
+
+
+def _read_json(path):
+    if orjson is not None:
+        # Decode first so bad bytes raise UnicodeDecodeError, not a JSON error that would discard the file
+        text = path.read_bytes().decode("utf-8")
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects Infinity/NaN, which the stdlib encoder writes; only json can call the file corrupt
+            return json.loads(text)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _encode_json(data, pretty=False):
+    # Compact by default; indented output is only produced for the readable export
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _write_json(path, data, pretty=False):
+    # Write to a sibling temp file and swap it in, so the old file survives a failed write
+    tmp = path.with_suffix(path.suffix + TEMP_SUFFIX)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_encode_json(data, pretty))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def fresh_default():
+    return {"income": dict.fromkeys(INCOME_CATEGORIES, 0.0), "expenses": dict.fromkeys(EXPENSE_CATEGORIES, 0.0)}
+
+
+_MISSING = object()
+
+
 def load_summary_data():
     path = _summary_path()
     if not path.exists():
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_SUMMARY, f, indent=4)
+        _write_json(path, _DEFAULT_SUMMARY)
         messagebox.showinfo("Summary File Created", f"Created '{SUMMARY_FILENAME}'.")
-        return json.loads(json.dumps(DEFAULT_SUMMARY))
+        return fresh_default()
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(path)
     except json.JSONDecodeError:
-        path.unlink(missing_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_SUMMARY, f, indent=4)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so this covers both decoders
+        _write_json(path, _DEFAULT_SUMMARY)
         messagebox.showwarning("Corrupted File Replaced", "Corrupted summary file replaced with a new blank file.")
-        return json.loads(json.dumps(DEFAULT_SUMMARY))
+        return fresh_default()
     except Exception as e:
         messagebox.showerror("File Error", f"Unable to read summary file:\n{e}")
-        return json.loads(json.dumps(DEFAULT_SUMMARY))
+        return fresh_default()
 
     repairs = []
     repaired = False
 
     for section, expected in (("income", INCOME_CATEGORIES), ("expenses", EXPENSE_CATEGORIES)):
         if section not in data or not isinstance(data[section], dict):
-            data[section] = {k: 0.0 for k in expected}
+            data[section] = dict.fromkeys(expected, 0.0)
             repairs.append(f"Added or replaced section '{section}'.")
             repaired = True
         else:
             # Ensure proper keys and numeric values
+            sec = data[section]
             for cat in expected:
-                if cat not in data[section]:
-                    data[section][cat] = 0.0
+                v = sec.get(cat, _MISSING)
+                if v is _MISSING:
+                    sec[cat] = 0.0
                     repairs.append(f"Added missing '{cat}' in '{section}'.")
                     repaired = True
+                    continue
+                if type(v) is float and math.isfinite(v):
+                    continue
                 try:
-                    data[section][cat] = float(data[section][cat])
+                    v = float(v)
+                    if not math.isfinite(v):
+                        raise ValueError(v)
+                    sec[cat] = v
                 except Exception:
-                    data[section][cat] = 0.0
+                    sec[cat] = 0.0
                     repairs.append(f"Reset invalid value for '{cat}' in '{section}'.")
                     repaired = True
 
     if repaired:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        _write_json(path, data)
         messagebox.showinfo("Repairs Made", "\n".join(repairs))
 
     return data
@@ -110,23 +181,22 @@ def load_summary_data():
 
 def save_summary_data(data):
     path = _summary_path()
-    backup = path.with_suffix(path.suffix + BACKUP_SUFFIX)
     try:
-        if path.exists():
-            shutil.copyfile(path, backup)
-    except Exception:
-        pass
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        _write_json(path, data)
     except Exception as e:
-        messagebox.showerror("Save Error", f"Could not save summary. Backup preserved as '{backup.name}'.\nDetails: {e}")
+        messagebox.showerror("Save Error", f"Could not save summary. Previous file left unchanged.\nDetails: {e}")
         return False
+    return True
+
+
+def export_summary_data(data):
+    path = _summary_path().with_name(EXPORT_FILENAME)
     try:
-        if backup.exists():
-            backup.unlink()
-    except Exception:
-        pass
+        _write_json(path, data, pretty=True)
+    except Exception as e:
+        messagebox.showerror("Export Error", f"Could not export summary.\nDetails: {e}")
+        return False
+    messagebox.showinfo("Export Complete", f"Readable copy saved as '{EXPORT_FILENAME}'.")
     return True
 
 
@@ -142,24 +212,51 @@ def validate_number(txt):
         v = float(s)
     except ValueError:
         return False, "Number is invalid or input was not a number.\nExample: 500; 503.81\nNo Symbols."
+    if not math.isfinite(v):
+        return False, "Value must be a finite number."
     if v <= 0:
         return False, "Value must be greater than 0."
     return True, v
 
 
-def interp_color(c1, c2, t):
-    def h2r(h):
-        h = h.lstrip("#")
-        return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-    r1, g1, b1 = h2r(c1)
-    r2, g2, b2 = h2r(c2)
-    r = int(r1 + (r2 - r1) * t)
-    g = int(g1 + (g2 - g1) * t)
-    b = int(b1 + (b2 - b1) * t)
-    return f"#{r:02x}{g:02x}{b:02x}"
+def _hex_to_rgb(h):
+    h = h.lstrip("#")
+    return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+
+
+def make_interp(c1, c2):
+    """Return a function mapping t in [0, 1] to a hex color between c1 and c2."""
+    r1, g1, b1 = _hex_to_rgb(c1)
+    r2, g2, b2 = _hex_to_rgb(c2)
+    dr, dg, db = r2 - r1, g2 - g1, b2 - b1
+    def interp(t):
+        return f"#{int(r1 + dr * t):02x}{int(g1 + dg * t):02x}{int(b1 + db * t):02x}"
+    return interp
+
+
+# Button gradients never change, so build them once and share across all buttons
+_BTN_STEPS = 40
+_btn_interp = make_interp(BTN_GRAD_TOP, BTN_GRAD_BOTTOM)
+_BTN_LUT_NORMAL = [_btn_interp(i / (_BTN_STEPS - 1)) for i in range(_BTN_STEPS)]
+_BTN_LUT_HOVER = _BTN_LUT_NORMAL[::-1]
+
+# Outline colors for the ContentBox pulse, shared by every box with the same border color
+_PULSE_STEPS = 8
+_PULSE_LUTS = {}
+
+
+def _pulse_lut(border_color):
+    lut = _PULSE_LUTS.get(border_color)
+    if lut is None:
+        interp = make_interp(border_color, "#FFFFFF")
+        lut = [interp((i / _PULSE_STEPS) * 0.4) for i in range(_PULSE_STEPS + 1)]
+        _PULSE_LUTS[border_color] = lut
+    return lut
 
 
 def format_currency(val):
+    if type(val) is float:
+        return f"${val:,.2f}"
     try:
         return f"${float(val):,.2f}"
     except Exception:
@@ -179,21 +276,41 @@ class GradientBackground:
         self.color2 = color2
         self.canvas = tk.Canvas(root, width=width, height=height, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
+        self._grad_img = self._build_image()
         self.draw_gradient()
 
-    def draw_gradient(self):
-        self.canvas.delete("all")
+    def _build_image(self):
+        if _HAVE_PIL:
+            # Vectorized path: interpolate every row at once and hand Tk a ready-made image
+            c1 = np.array(_hex_to_rgb(self.color1), dtype=np.float32)
+            c2 = np.array(_hex_to_rgb(self.color2), dtype=np.float32)
+            t = np.linspace(0, 1, self.height, dtype=np.float32)[:, None]
+            rgb = (c1 * (1 - t) + c2 * t).astype(np.uint8)
+            pixels = np.ascontiguousarray(np.broadcast_to(rgb[:, None, :], (self.height, self.width, 3)))
+            return ImageTk.PhotoImage(Image.fromarray(pixels, "RGB"), master=self.root)
+        # Render one pixel column with the whole gradient, then stretch it to full width
         steps = max(150, self.height // 3)
-        for i in range(steps):
-            t = i / (steps - 1)
-            color = interp_color(self.color1, self.color2, t)
-            y1 = int(i * (self.height / steps))
-            y2 = int((i + 1) * (self.height / steps))
-            self.canvas.create_rectangle(0, y1, self.width, y2, outline=color, fill=color)
+        interp = make_interp(self.color1, self.color2)
+        lut = [interp(i / (steps - 1)) for i in range(steps)]
+        ys = [int(i * (self.height / steps)) for i in range(steps)] + [self.height]
+        rows = []
+        for i, color in enumerate(lut):
+            rows.extend(["{" + color + "}"] * (ys[i + 1] - ys[i]))
+        column = tk.PhotoImage(master=self.root, width=1, height=self.height)
+        column.put(" ".join(rows), to=(0, 0))
+        return column.zoom(self.width, 1)
+
+    def draw_gradient(self):
+        # Only touch the background item; page windows live on the same canvas
+        self.canvas.delete("bg")
+        self.canvas.create_image(0, 0, anchor="nw", image=self._grad_img, tags="bg")
+        self.canvas.tag_lower("bg")
 
 
 class GlowButton(tk.Canvas):
     """Gradient button that glows and is clickable."""
+    _ys_cache = {}
+
     def __init__(self, parent, text, command, width=BUTTON_WIDTH, height=BUTTON_HEIGHT, font=None):
         super().__init__(parent, width=width, height=height, bd=0, highlightthickness=0, cursor="hand2")
         self.text = text
@@ -201,34 +318,38 @@ class GlowButton(tk.Canvas):
         self.font = font or ("Helvetica", 13, "bold")
         self.width = width
         self.height = height
-        self.normal_top = BTN_GRAD_TOP
-        self.normal_bottom = BTN_GRAD_BOTTOM
-        self.hover_top = BTN_GRAD_BOTTOM
-        self.hover_bottom = BTN_GRAD_TOP
         self.glow_color = GLOW_COLOR
         self.text_color = BTN_TEXT
-        self._draw_button(self.normal_top, self.normal_bottom)
+        self._ys = self._row_coords(width, height)
+        self._draw_button(_BTN_LUT_NORMAL)
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
         self.bind("<Button-1>", lambda e: self.command())
 
-    def _draw_button(self, top, bottom):
+    @classmethod
+    def _row_coords(cls, width, height):
+        key = (width, height)
+        ys = cls._ys_cache.get(key)
+        if ys is None:
+            ys = [int(i * (height / _BTN_STEPS)) for i in range(_BTN_STEPS + 1)]
+            cls._ys_cache[key] = ys
+        return ys
+
+    def _draw_button(self, lut):
         self.delete("all")
-        steps = 40
-        for i in range(steps):
-            t = i / (steps - 1)
-            color = interp_color(top, bottom, t)
-            y1 = int(i * (self.height / steps))
-            y2 = int((i + 1) * (self.height / steps))
-            self.create_rectangle(0, y1, self.width, y2, outline=color, fill=color)
+        create_rect = self.create_rectangle
+        ys = self._ys
+        width = self.width
+        for i, color in enumerate(lut):
+            create_rect(0, ys[i], width, ys[i + 1], outline=color, fill=color)
         self.create_rectangle(2, 2, self.width - 2, self.height - 2, outline=self.glow_color, width=2)
         self.create_text(self.width // 2, self.height // 2, text=self.text, font=self.font, fill=self.text_color)
 
     def _on_enter(self, event):
-        self._draw_button(self.hover_top, self.hover_bottom)
+        self._draw_button(_BTN_LUT_HOVER)
 
     def _on_leave(self, event):
-        self._draw_button(self.normal_top, self.normal_bottom)
+        self._draw_button(_BTN_LUT_NORMAL)
 
 
 class ContentBox:
@@ -242,6 +363,7 @@ class ContentBox:
         self.inner_frame = tk.Frame(self.canvas, bg=self.bg_color)
         pad = 12
         self.canvas.create_window(pad, pad, window=self.inner_frame, anchor="nw", width=width - 2 * pad, height=height - 2 * pad)
+        self._pulse_lut = _pulse_lut(self.border_color)
         self._anim_in_progress = False
 
     def get_widget(self):
@@ -251,15 +373,12 @@ class ContentBox:
         if self._anim_in_progress:
             return
         self._anim_in_progress = True
-        steps = 8
         def step_up(i=0):
-            if i > steps:
+            if i >= len(self._pulse_lut):
                 self.canvas.itemconfig(self.outline_id, outline=self.border_color)
                 self._anim_in_progress = False
                 return
-            t = i / steps
-            color = interp_color(self.border_color, "#FFFFFF", t * 0.4)
-            self.canvas.itemconfig(self.outline_id, outline=color)
+            self.canvas.itemconfig(self.outline_id, outline=self._pulse_lut[i])
             self.canvas.after(30, step_up, i + 1)
         step_up(0)
 
@@ -291,6 +410,11 @@ class PFTrackerApp:
         self.FONT_FOOTER = (self.font_family, 9, "italic")
 
         self.bg = GradientBackground(root, WINDOW_WIDTH, WINDOW_HEIGHT, GRADIENT_TOP, GRADIENT_BOTTOM)
+        self.data = load_summary_data()
+        self._save_pending = None
+        # Values each category held before its first unsaved submit, restored if the save fails
+        self._unsaved = {}
+        root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.frames = {}
         self._build_main()
         self._build_income()
@@ -298,22 +422,19 @@ class PFTrackerApp:
         self._build_summary()
         self.show_page("main")
 
+    def _add_page(self, key, box, on_show=None):
+        win_id = self.bg.canvas.create_window(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, window=box.get_widget(), anchor="c", state="hidden")
+        self.frames[key] = {"box": box, "win_id": win_id, "on_show": on_show}
+
     def _clear(self):
         for info in self.frames.values():
-            if "win_id" in info:
-                try:
-                    self.bg.canvas.delete(info["win_id"])
-                except Exception:
-                    pass
+            self.bg.canvas.itemconfigure(info["win_id"], state="hidden")
 
     def show_page(self, key):
         self._clear()
-        self.bg.draw_gradient()
         info = self.frames[key]
-        box = info["box"]
-        win_id = self.bg.canvas.create_window(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, window=box.get_widget(), anchor="c")
-        info["win_id"] = win_id
-        box.animate_pulse()
+        self.bg.canvas.itemconfigure(info["win_id"], state="normal")
+        info["box"].animate_pulse()
         if info.get("on_show"):
             info["on_show"]()
 
@@ -335,7 +456,7 @@ class PFTrackerApp:
         GlowButton(btn_area, "Exit Program", self._on_exit, font=self.FONT_BTN).pack(pady=8)
 
         tk.Label(inner, text="© 2025 Personal Finance Tracker", font=self.FONT_FOOTER, fg="#CCCCCC", bg=CONTENT_BG).pack(pady=(16, 0))
-        self.frames["main"] = {"box": box}
+        self._add_page("main", box)
 
     def _build_income(self):
         box = ContentBox(self.bg, BOX_WIDTH, OTHER_BOX_HEIGHT)
@@ -346,12 +467,12 @@ class PFTrackerApp:
         self.income_entry.pack(pady=6)
         tk.Label(inner, text="Select income category:", font=self.FONT_NORMAL, fg="white", bg=CONTENT_BG).pack()
         self.income_var = tk.StringVar(value=INCOME_CATEGORIES[0])
-        ttk.OptionMenu(inner, self.income_var, INCOME_CATEGORIES[0], *INCOME_CATEGORIES).pack(pady=6)
+        ttk.Combobox(inner, textvariable=self.income_var, values=INCOME_CATEGORIES, state="readonly").pack(pady=6)
         btns = tk.Frame(inner, bg=CONTENT_BG)
         btns.pack(pady=8)
         GlowButton(btns, "Submit Income", self._submit_income, font=self.FONT_BTN).pack(pady=6)
         GlowButton(btns, "Return to Main Menu", lambda: self.show_page("main"), font=self.FONT_BTN).pack(pady=6)
-        self.frames["income"] = {"box": box}
+        self._add_page("income", box)
 
     def _build_expense(self):
         box = ContentBox(self.bg, BOX_WIDTH, OTHER_BOX_HEIGHT)
@@ -362,23 +483,31 @@ class PFTrackerApp:
         self.expense_entry.pack(pady=6)
         tk.Label(inner, text="Select expense category:", font=self.FONT_NORMAL, fg="white", bg=CONTENT_BG).pack()
         self.expense_var = tk.StringVar(value=EXPENSE_CATEGORIES[0])
-        ttk.OptionMenu(inner, self.expense_var, EXPENSE_CATEGORIES[0], *EXPENSE_CATEGORIES).pack(pady=6)
+        ttk.Combobox(inner, textvariable=self.expense_var, values=EXPENSE_CATEGORIES, state="readonly").pack(pady=6)
         btns = tk.Frame(inner, bg=CONTENT_BG)
         btns.pack(pady=8)
         GlowButton(btns, "Submit Expense", self._submit_expense, font=self.FONT_BTN).pack(pady=6)
         GlowButton(btns, "Return to Main Menu", lambda: self.show_page("main"), font=self.FONT_BTN).pack(pady=6)
-        self.frames["expense"] = {"box": box}
+        self._add_page("expense", box)
 
     def _build_summary(self):
         box = ContentBox(self.bg, BOX_WIDTH, SUMMARY_BOX_HEIGHT)
         inner = box.inner_frame
         tk.Label(inner, text="Summary Report", font=self.FONT_TITLE, fg=GRADIENT_BOTTOM, bg=CONTENT_BG).pack(pady=(8, 10))
-        self.summary_frame = tk.Frame(inner, bg=CONTENT_BG)
-        self.summary_frame.pack(fill="both", expand=True)
         btns = tk.Frame(inner, bg=CONTENT_BG)
-        btns.pack(pady=8)
-        GlowButton(btns, "Return to Main Menu", lambda: self.show_page("main"), font=self.FONT_BTN).pack(pady=6)
-        self.frames["summary"] = {"box": box, "on_show": self._populate_summary}
+        btns.pack(side="bottom", pady=8)
+        GlowButton(btns, "Export Readable Copy", lambda: export_summary_data(self.data), width=280, font=self.FONT_BTN).pack(side="left", padx=6)
+        GlowButton(btns, "Return to Main Menu", lambda: self.show_page("main"), width=280, font=self.FONT_BTN).pack(side="left", padx=6)
+        self.summary_text = tk.Text(inner, height=16, bg=CONTENT_BG, fg="white", font=self.FONT_NORMAL, bd=0,
+                                    highlightthickness=0, wrap="none", cursor="arrow", state="disabled")
+        net_font = (self.font_family, 12, "bold")
+        self.summary_text.tag_configure("good", foreground="#9CFF00", font=net_font, spacing3=8)
+        self.summary_text.tag_configure("bad", foreground="#FF6B6B", font=net_font, spacing3=8)
+        self.summary_text.tag_configure("even", foreground="#FFFFFF", font=net_font, spacing3=8)
+        self.summary_text.tag_configure("header", foreground="#9CFF00", font=(self.font_family, 11, "bold"))
+        self.summary_text.tag_configure("gap", spacing1=8)
+        self.summary_text.pack(fill="both", expand=True)
+        self._add_page("summary", box, on_show=self._populate_summary)
 
 # --------------------------------------------------
 # The 4 Options That The User Can Choose
@@ -389,69 +518,111 @@ class PFTrackerApp:
         if not valid:
             messagebox.showerror("Invalid Input", val)
             return
-        data = load_summary_data()
         cat = self.income_var.get()
-        data["income"][cat] += val
-        if save_summary_data(data):
-            messagebox.showinfo("Success", "Income added successfully.")
-            self.income_entry.delete(0, "end")
-            self.show_page("main")
+        if not self._add_amount("income", cat, val):
+            return
+        messagebox.showinfo("Success", "Income added successfully.")
+        self.income_entry.delete(0, "end")
+        self.show_page("main")
 
     def _submit_expense(self):
         valid, val = validate_number(self.expense_entry.get())
         if not valid:
             messagebox.showerror("Invalid Input", val)
             return
-        data = load_summary_data()
         cat = self.expense_var.get()
-        data["expenses"][cat] += val
-        if save_summary_data(data):
-            messagebox.showinfo("Success", "Expense added successfully.")
-            self.expense_entry.delete(0, "end")
-            self.show_page("main")
+        if not self._add_amount("expenses", cat, val):
+            return
+        messagebox.showinfo("Success", "Expense added successfully.")
+        self.expense_entry.delete(0, "end")
+        self.show_page("main")
+
+    def _add_amount(self, section, cat, val):
+        total = self.data[section][cat] + val
+        if not math.isfinite(total):
+            messagebox.showerror("Invalid Input", f"Adding this amount would make '{cat}' too large to store.")
+            return False
+        self._unsaved.setdefault((section, cat), self.data[section][cat])
+        self.data[section][cat] = total
+        self._schedule_save()
+        return True
+
+    def _schedule_save(self):
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+        self._save_pending = self.root.after(SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self):
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+            self._save_pending = None
+        if not self._unsaved:
+            return
+        if not save_summary_data(self.data):
+            # Keep memory in step with the file on disk so a resubmit is not counted twice
+            for (section, cat), saved in self._unsaved.items():
+                self.data[section][cat] = saved
+            messagebox.showwarning("Entries Discarded", "Entries added since the last save were not recorded.")
+        self._unsaved.clear()
 
     def _populate_summary(self):
-        for w in self.summary_frame.winfo_children():
-            w.destroy()
-        rep = calculate_summary()
+        text = self.summary_text
+        text.config(state="normal")
+        text.delete("1.0", "end")
+        rep = calculate_summary(self.data)
         if rep is None:
-            tk.Label(self.summary_frame, text="No entries yet.", bg=CONTENT_BG, fg="white", font=self.FONT_NORMAL).pack(anchor="w")
+            text.insert("end", "No entries yet.\n")
+            text.config(state="disabled")
             return
-        tk.Label(self.summary_frame, text=f"Total Income: {format_currency(rep['total_income'])}", bg=CONTENT_BG, fg="white", font=self.FONT_NORMAL).pack(anchor="w")
-        tk.Label(self.summary_frame, text=f"Total Expenses: {format_currency(rep['total_expenses'])}", bg=CONTENT_BG, fg="white", font=self.FONT_NORMAL).pack(anchor="w")
         net = rep["net_balance"]
-        net_color = "#9CFF00" if net > 0 else "#FF6B6B" if net < 0 else "#FFFFFF"
-        tk.Label(self.summary_frame, text=f"Net Balance: {format_currency(net)}", bg=CONTENT_BG, fg=net_color, font=(self.font_family, 12, "bold")).pack(anchor="w", pady=(0, 8))
-        tk.Label(self.summary_frame, text="Income by Category:", bg=CONTENT_BG, fg="#9CFF00", font=(self.font_family, 11, "bold")).pack(anchor="w")
+        net_tag = "good" if net > 0 else "bad" if net < 0 else "even"
+        text.insert("end", f"Total Income: {format_currency(rep['total_income'])}\n")
+        text.insert("end", f"Total Expenses: {format_currency(rep['total_expenses'])}\n")
+        text.insert("end", f"Net Balance: {format_currency(net)}\n", (net_tag,))
+        text.insert("end", "Income by Category:\n", ("header",))
         for cat in INCOME_CATEGORIES:
-            tk.Label(self.summary_frame, text=f"  {cat}: {format_currency(rep['income'].get(cat, 0.0))}", bg=CONTENT_BG, fg="white", font=self.FONT_NORMAL).pack(anchor="w")
-        tk.Label(self.summary_frame, text="Expenses by Category:", bg=CONTENT_BG, fg="#9CFF00", font=(self.font_family, 11, "bold")).pack(anchor="w", pady=(8, 0))
+            text.insert("end", f"  {cat}: {format_currency(rep['income'].get(cat, 0.0))}\n")
+        text.insert("end", "Expenses by Category:\n", ("header", "gap"))
         for cat in EXPENSE_CATEGORIES:
-            tk.Label(self.summary_frame, text=f"  {cat}: {format_currency(rep['expenses'].get(cat, 0.0))}", bg=CONTENT_BG, fg="white", font=self.FONT_NORMAL).pack(anchor="w")
+            text.insert("end", f"  {cat}: {format_currency(rep['expenses'].get(cat, 0.0))}\n")
+        text.config(state="disabled")
 
     def _on_exit(self):
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
-            d = load_summary_data()
-            save_summary_data(d)
+            self._flush_save()
             self.root.quit()
 
+    def _on_close(self):
+        # Closing the window must not drop a save that is still waiting on its timer
+        self._flush_save()
+        self.root.destroy()
+
 
 # --------------------------------------------------
 # Summary Calculator
 # --------------------------------------------------
 
-def calculate_summary():
-    data = load_summary_data()
-    total_income = sum(float(v) for v in data.get("income", {}).values())
-    total_expenses = sum(float(v) for v in data.get("expenses", {}).values())
+def _total(values):
+    # fsum raises where plain sum would overflow to inf; keep the report renderable
+    try:
+        return math.fsum(values)
+    except OverflowError:
+        return float("inf")
+
+
+def calculate_summary(data):
+    # Only the known categories are normalized to float by load_summary_data (and shown in the report)
+    income, expenses = data["income"], data["expenses"]
+    total_income = _total(income[c] for c in INCOME_CATEGORIES)
+    total_expenses = _total(expenses[c] for c in EXPENSE_CATEGORIES)
     if total_income == 0 and total_expenses == 0:
         return None
     return {
         "total_income": total_income,
         "total_expenses": total_expenses,
         "net_balance": total_income - total_expenses,
-        "income": data.get("income", {}),
-        "expenses": data.get("expenses", {}),
+        "income": income,
+        "expenses": expenses,
     }
 
 